@@ -4,6 +4,7 @@ from pathlib import Path
 class Config:
     ROOT_DIR: Path = Path(__file__).parent.parent.parent
     CONF_FILE_PATH: Path = ROOT_DIR / "conf.json"
+    CONF_SAVE_COALESCE_SECS: float = 0.2
 
 
 config = Config()
@@ -4,6 +4,7 @@ from pydantic_settings import BaseSettings
 class Config(BaseSettings):
     VCAM_FRAME_QUEUE_SIZE: int = 4
     STATS_QUEUE_SIZE: int = 4
+    STATS_INTERVAL_SECS: float = 1.0
 
     ROUNT_TRIP_TIME_THRESHOLD: float = 0.03  # seconds
 
@@ -0,0 +1,12 @@
+import cv2
+
+from app.media.webcam import CvFrame
+
+# Below this scale bilinear starts to alias, so area averaging is worth its extra cost
+AREA_SCALE_THRESHOLD = 0.5
+
+
+def resize_frame(frame: CvFrame, size: tuple[int, int]) -> CvFrame:
+    """Resize a frame to (width, height), area averaging only for strong shrinks and bilinear otherwise."""
+    interpolation = cv2.INTER_AREA if size[0] < frame.shape[1] * AREA_SCALE_THRESHOLD else cv2.INTER_LINEAR
+    return cv2.resize(frame, size, interpolation=interpolation)
@@ -1,6 +1,5 @@
 from collections.abc import Callable
 
-import cv2
 from aiortc import VideoStreamTrack
 from av import VideoFrame
 
@@ -23,11 +22,8 @@ class WebcamVideoTrack(VideoStreamTrack):
         # Capture frame
         frame = self.read_func()
 
-        # Convert BGR to RGB
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # Create VideoFrame
-        video_frame = VideoFrame.from_ndarray(frame, format="rgb24")  # type: ignore  # noqa: PGH003
+        # Create VideoFrame, PyAV copies the BGR pixels and the encoder converts them to YUV
+        video_frame = VideoFrame.from_ndarray(frame, format="bgr24")
         video_frame.pts = pts
         video_frame.time_base = time_base
 
@@ -18,6 +18,7 @@ class Webcam:
         height: int,
         fps: int,
         pre_process_callback: Callable[[CvFrame], CvFrame] | None = None,
+        on_frame_ready_callback: Callable[[CvFrame], None] | None = None,
     ) -> None:
         self.device = device
         self.width = width
@@ -25,11 +26,15 @@ class Webcam:
         self.fps = fps
 
         self.pre_process_callback = pre_process_callback
+        self.on_frame_ready_callback = on_frame_ready_callback
 
         self.cap: cv2.VideoCapture | None = None
         self.last_frame: CvFrame = np.zeros((self.height, self.width, 3), np.uint8)
         self.last_frame_lock = threading.Lock()
 
+        # While paused the device stays open, but frames are neither decoded nor pre-processed
+        self.paused = False
+
         self.read_thread: threading.Thread | None = None
         self.read_thread_stop_event = threading.Event()
 
@@ -62,6 +67,7 @@ class Webcam:
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
         self.cap.set(cv2.CAP_PROP_FPS, self.fps)
         self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))  # type: ignore  # noqa: PGH003
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Keep only the newest frame queued in the driver
 
         self.read_thread_stop_event.clear()
         self.read_thread = threading.Thread(target=self.read_loop, daemon=True)
@@ -78,6 +84,10 @@ class Webcam:
             self.cap.release()
             self.cap = None
 
+    def set_fps(self, fps: int) -> None:
+        """Change the capture rate without reopening the device. Applied by the read thread."""
+        self.fps = fps
+
     def _read(self) -> tuple[bool, CvFrame]:
         if self.cap is None:
             return False, CvFrame(0)
@@ -92,16 +102,30 @@ class Webcam:
         return True, frame
 
     def read_loop(self) -> None:
-        last_tstamp = time.time()
-        delay = 1.0 / self.fps
-        while not self.read_thread_stop_event.is_set():
-            if time.time() - last_tstamp >= delay:
-                last_tstamp = time.time()
-
-                ok, frame = self._read()
-                if ok:
-                    self.last_frame = frame
-            time.sleep(0.001)
+        fps = self.fps
+        next_tstamp = time.monotonic()
+
+        # Sleep until the next frame is due, waking early only to stop
+        while not self.read_thread_stop_event.wait(timeout=max(next_tstamp - time.monotonic(), 0.0)):
+            # VideoCapture is not thread safe, so fps changes are applied here rather than in set_fps
+            if fps != self.fps and self.cap is not None:
+                fps = self.fps
+                self.cap.set(cv2.CAP_PROP_FPS, fps)
+
+            next_tstamp = time.monotonic() + 1.0 / fps
+
+            if self.paused:
+                # Keep draining the driver buffer so the first frame after resuming is fresh
+                if self.cap is not None:
+                    self.cap.grab()
+                continue
+
+            ok, frame = self._read()
+            if ok:
+                self.last_frame = frame
+                if self.on_frame_ready_callback is not None:
+                    self.on_frame_ready_callback(frame)
 
     def read(self) -> CvFrame:
-        return self.last_frame.copy()
+        """Return the latest frame. It is shared with other readers and must not be modified in place."""
+        return self.last_frame
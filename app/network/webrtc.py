@@ -1,9 +1,8 @@
 import asyncio
 from collections.abc import Callable, Coroutine
-from typing import Any
+from typing import Any, cast
 
 import aiohttp
-import cv2
 from aiortc import MediaStreamTrack, RTCPeerConnection, RTCSessionDescription
 from loguru import logger
 
@@ -21,9 +20,12 @@ class WebRTCClient:
         read_frame_func: Callable[[], CvFrame],
         on_recv_frame_callback: Callable[[CvFrame, int], Coroutine[Any, Any, None]] | None = None,
         on_disconnect_callback: Callable[[], Coroutine[Any, Any, None]] | None = None,
+        http_session: aiohttp.ClientSession | None = None,
     ) -> None:
         self.pc = RTCPeerConnection()
-        self.recv_frames: asyncio.Queue[CvFrame] = asyncio.Queue(maxsize=10)
+        # Latest-wins slot for received frames, stale frames are overwritten instead of queued
+        self.latest_frame: CvFrame | None = None
+        self.frame_ready = asyncio.Event()
 
         self.stop_event = asyncio.Event()
         self.track_task: asyncio.Task[None] | None = None
@@ -36,6 +38,9 @@ class WebRTCClient:
         self.on_recv_frame_callback = on_recv_frame_callback
         self.on_disconnect_callback = on_disconnect_callback
 
+        # Optional caller-owned session, reusing it keeps the HTTP connection alive across reconnects
+        self.http_session = http_session
+
     async def connect(self) -> None:
         """Establish WebRTC connection with server"""
 
@@ -51,18 +56,16 @@ class WebRTCClient:
                 try:
                     while not self.stop_event.is_set():
                         frame = await track.recv()
-                        # Convert to numpy array for display
-                        img = frame.to_ndarray(format="rgb24")  # type: ignore  # noqa: PGH003
-                        img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+                        # Convert to a BGR numpy array, PyAV converts from YUV straight into BGR order
+                        img = frame.to_ndarray(format="bgr24")  # type: ignore  # noqa: PGH003
 
                         # Call external callback
                         if self.on_recv_frame_callback is not None:
                             await self.on_recv_frame_callback(img, frame.pts or 0)
 
-                        # Put frame in queue (non-blocking)
-                        if self.recv_frames.full():
-                            self.recv_frames.get_nowait()
-                        self.recv_frames.put_nowait(img)
+                        # Publish the newest frame
+                        self.latest_frame = img
+                        self.frame_ready.set()
 
                 except Exception as e:
                     logger.error(f"Error receiving frame: {e}")
@@ -77,9 +80,9 @@ class WebRTCClient:
         await self.pc.setLocalDescription(offer)
 
         # Send offer to server
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(
+        session = self.http_session or aiohttp.ClientSession()
+        try:
+            async with session.post(
                 self.offer_url,
                 json={
                     "sdp": self.pc.localDescription.sdp,
@@ -89,18 +92,20 @@ class WebRTCClient:
                 },
                 headers={"Content-Type": "application/json"},
                 timeout=aiohttp.ClientTimeout(total=cfg_rtc.HTTP_REQUEST_TIMEOUT),
-            ) as response,
-        ):
-            answer = await response.json()
+            ) as response:
+                answer = await response.json()
 
-            # Set remote description
-            await self.pc.setRemoteDescription(RTCSessionDescription(sdp=answer["sdp"], type=answer["type"]))
+                # Set remote description
+                await self.pc.setRemoteDescription(RTCSessionDescription(sdp=answer["sdp"], type=answer["type"]))
+        finally:
+            if session is not self.http_session:
+                await session.close()
 
         logger.success("WebRTC connection established")
 
     async def get_remote_frame(self, timeout: float | None = None) -> CvFrame:  # noqa: ASYNC109
         """
-        Get processed frame from server.
+        Get the newest processed frame from server.
 
         Args:
             timeout (float | None, optional): Timeout in seconds. Defaults to None.
@@ -112,16 +117,17 @@ class WebRTCClient:
         Raises:
             TimeoutError: If no frame is available within the specified timeout.
         """
-        return (
-            await asyncio.wait_for(self.recv_frames.get(), timeout=timeout)
-            if timeout is not None
-            else await self.recv_frames.get()
-        )
+        if timeout is not None:
+            await asyncio.wait_for(self.frame_ready.wait(), timeout=timeout)
+        else:
+            await self.frame_ready.wait()
+
+        self.frame_ready.clear()
+        return cast("CvFrame", self.latest_frame)
 
     async def _wait_for_video_track(self) -> None:
         """Hold client loop alive until stop event is set."""
-        while not self.stop_event.is_set():  # noqa: ASYNC110
-            await asyncio.sleep(0.1)
+        await self.stop_event.wait()
 
     async def close(self) -> None:
         """Close connection and cleanup"""
@@ -1,3 +1,6 @@
+import queue
+import threading
+import time
 from enum import StrEnum
 
 from loguru import logger
@@ -50,8 +53,56 @@ class AppConfig(BaseModel):
         return cls()
 
     def save(self) -> None:
+        tmp_path = cfg_fs.CONF_FILE_PATH.with_name(f"{cfg_fs.CONF_FILE_PATH.name}.tmp")
         try:
-            with cfg_fs.CONF_FILE_PATH.open("w") as f:
-                f.write(self.model_dump_json(indent=2))
+            # Write a temporary file and swap it in, so an interrupted save never leaves a truncated config
+            with _save_lock:
+                tmp_path.write_text(self.model_dump_json(indent=2))
+                tmp_path.replace(cfg_fs.CONF_FILE_PATH)
         except Exception:
             logger.error(f"Failed to save app data to: {cfg_fs.CONF_FILE_PATH}")
+
+    def save_async(self) -> None:
+        """
+        Request a save on the background writer thread.
+
+        Requests posted while a write is in progress are coalesced into a single write.
+        """
+        global _save_thread  # noqa: PLW0603
+
+        with _save_thread_lock:
+            if _save_thread is None:
+                _save_thread = threading.Thread(target=_save_loop, daemon=True)
+                _save_thread.start()
+
+        _save_queue.put(self)
+
+    def flush(self) -> None:
+        """Drop pending background save requests and save synchronously."""
+        _drain_save_queue()
+        self.save()
+
+
+_save_lock = threading.Lock()
+_save_queue: queue.Queue[AppConfig] = queue.Queue()
+_save_thread: threading.Thread | None = None
+_save_thread_lock = threading.Lock()
+
+
+def _drain_save_queue() -> AppConfig | None:
+    latest = None
+    while True:
+        try:
+            latest = _save_queue.get_nowait()
+        except queue.Empty:
+            return latest
+
+
+def _save_loop() -> None:
+    while True:
+        app_cfg = _save_queue.get()
+        app_cfg = _drain_save_queue() or app_cfg
+        app_cfg.save()
+
+        # Let bursts of requests (e.g. slider drags) pile up into the next write
+        time.sleep(cfg_fs.CONF_SAVE_COALESCE_SECS)
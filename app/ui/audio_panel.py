@@ -142,7 +142,7 @@ class AudioPanel(ttk.LabelFrame):
 
         self.app_cfg.input_device_idx = self.input_device_combo.current()
         self.app_cfg.output_device_idx = self.output_device_combo.current()
-        self.app_cfg.save()
+        self.app_cfg.save_async()
 
         if self.reconnect_audio_callback:
             self.reconnect_audio_callback()
@@ -152,7 +152,7 @@ class AudioPanel(ttk.LabelFrame):
     def handle_input_device_selected(self, _event: tk.Event) -> None:
         self.status_callback(f"Input device selected: {self.input_device_var.get()}")
         self.app_cfg.input_device_idx = self.input_device_combo.current()
-        self.app_cfg.save()
+        self.app_cfg.save_async()
 
         if self.reconnect_audio_callback:
             self.reconnect_audio_callback()
@@ -160,7 +160,7 @@ class AudioPanel(ttk.LabelFrame):
     def handle_output_device_selected(self, _event: tk.Event) -> None:
         self.status_callback(f"Output device selected: {self.output_device_var.get()}")
         self.app_cfg.output_device_idx = self.output_device_combo.current()
-        self.app_cfg.save()
+        self.app_cfg.save_async()
 
         if self.reconnect_audio_callback:
             self.reconnect_audio_callback()
@@ -171,7 +171,7 @@ class AudioPanel(ttk.LabelFrame):
         self.delay_value_label.config(text=f"{value:.1f} secs")
 
         self.app_cfg.delay_secs = value
-        self.app_cfg.save()
+        self.app_cfg.save_async()
 
         if self.reconnect_audio_callback:
             self.reconnect_audio_callback()
@@ -6,6 +6,11 @@ from app.media.webcam import Webcam
 from app.schema.app_data import AppConfig, StreamingStatus
 from app.schema.camera_resolution import CAMERA_RESOLUTIONS, CameraResolution
 
+_RES_ORDER = tuple(CameraResolution)
+_RES_INDEX = {cr: i for i, cr in enumerate(_RES_ORDER)}
+_RES_LABELS = tuple(f"{cr.value} ({CAMERA_RESOLUTIONS[cr][0]}x{CAMERA_RESOLUTIONS[cr][1]})" for cr in _RES_ORDER)
+_FPS_VALUES = ("5", "10", "15", "20", "30")
+
 
 class CameraPanel(ttk.LabelFrame):
     """Camera configuration panel"""
@@ -32,8 +37,9 @@ class CameraPanel(ttk.LabelFrame):
         self.camera_var = tk.StringVar()
         self.camera_combo = ttk.Combobox(
             self,
+            name="camera",
             textvariable=self.camera_var,
-            values=[f"{dev[1]}" for dev in devices],
+            values=tuple(dev[1] for dev in devices),
             state="readonly",
         )
         self.camera_combo.grid(row=1, column=1, pady=2, sticky="ew")
@@ -42,35 +48,31 @@ class CameraPanel(ttk.LabelFrame):
         else:
             messagebox.showerror("Error", "No cameras found")
             self.app_cfg.camera_id = -1
-        self.camera_combo.bind("<<ComboboxSelected>>", self.handle_camera_change)
 
         # Resolution selection
         ttk.Label(self, text="Resolution:").grid(row=2, column=0, sticky="w", pady=2)
         self.resolution_var = tk.StringVar()
         self.resolution_combo = ttk.Combobox(
             self,
+            name="resolution",
             textvariable=self.resolution_var,
-            values=[
-                f"{cr.value} ({CAMERA_RESOLUTIONS[cr][0]}x{CAMERA_RESOLUTIONS[cr][1]})" for cr in list(CameraResolution)
-            ],
+            values=_RES_LABELS,
             state="readonly",
         )
         self.resolution_combo.grid(row=2, column=1, pady=2, sticky="ew")
-        self.resolution_combo.current(list(CameraResolution).index(self.app_cfg.resolution))
-        self.resolution_combo.bind("<<ComboboxSelected>>", self.handle_resolution_change)
+        self.resolution_combo.current(_RES_INDEX[self.app_cfg.resolution])
 
         # FPS selection
         ttk.Label(self, text="FPS:").grid(row=3, column=0, sticky="w", pady=2)
-        self.fps_var = tk.StringVar()
+        self.fps_var = tk.IntVar(value=self.app_cfg.fps)
         self.fps_combo = ttk.Combobox(
             self,
+            name="fps",
             textvariable=self.fps_var,
-            values=["5", "10", "15", "20", "30"],
+            values=_FPS_VALUES,
             state="readonly",
         )
         self.fps_combo.grid(row=3, column=1, pady=2, sticky="ew")
-        self.fps_combo.set(str(self.app_cfg.fps))
-        self.fps_combo.bind("<<ComboboxSelected>>", self.handle_fps_change)
 
         # Zoom slider
         ttk.Label(self, text="Zoom:").grid(row=4, column=0, sticky="w", pady=2)
@@ -88,31 +90,40 @@ class CameraPanel(ttk.LabelFrame):
         self.zoom_value_label = ttk.Label(self, text=f"{self.zoom_var.get():.1f}x")
         self.zoom_value_label.grid(row=4, column=2, sticky="w")
 
+        # Route <<ComboboxSelected>> of all combos through a single panel-level binding
+        self.combo_handlers: dict[str, Callable[[], None]] = {
+            "camera": self.handle_camera_change,
+            "resolution": self.handle_resolution_change,
+            "fps": self.handle_fps_change,
+        }
+        for combo in (self.camera_combo, self.resolution_combo, self.fps_combo):
+            combo.bindtags((*combo.bindtags(), str(self)))
+        self.bind("<<ComboboxSelected>>", self.handle_combo_selected)
+
+        # Widgets locked while streaming
+        self.lockable_widgets: tuple[ttk.Widget, ...] = (
+            self.refrech_camera_list_btn,
+            self.camera_combo,
+            self.resolution_combo,
+            self.fps_combo,
+        )
+
         self.columnconfigure(1, weight=1)
 
     def update_ui(self, status: StreamingStatus) -> None:
-        if status in [
+        # Flip only the "disabled" flag, so the comboboxes keep their "readonly" flag when re-enabled
+        enabled = status in [
             StreamingStatus.IDLE,
             StreamingStatus.DISCONNECTED,
-        ]:
-            self.refrech_camera_list_btn["state"] = "normal"
-            self.camera_combo["state"] = "readonly"
-            self.resolution_combo["state"] = "readonly"
-            self.fps_combo["state"] = "readonly"
-        elif status in [
-            StreamingStatus.CONNECTING,
-            StreamingStatus.CONNECTED,
-            StreamingStatus.DISCONNECTING,
-        ]:
-            self.refrech_camera_list_btn["state"] = "disabled"
-            self.camera_combo["state"] = "disabled"
-            self.resolution_combo["state"] = "disabled"
-            self.fps_combo["state"] = "disabled"
-        else:
-            self.refrech_camera_list_btn["state"] = "disabled"
-            self.camera_combo["state"] = "disabled"
-            self.resolution_combo["state"] = "disabled"
-            self.fps_combo["state"] = "disabled"
+        ]
+        state_spec = ["!disabled"] if enabled else ["disabled"]
+        for widget in self.lockable_widgets:
+            widget.state(state_spec)  # type: ignore  # noqa: PGH003
+
+    def handle_combo_selected(self, event: tk.Event) -> None:
+        handler = self.combo_handlers.get(event.widget.winfo_name())
+        if handler is not None:
+            handler()
 
     def handle_refresh_camera_list(self) -> None:
         devices = Webcam.list_webcams()
@@ -122,27 +133,30 @@ class CameraPanel(ttk.LabelFrame):
             self.app_cfg.camera_id = -1
             return
 
-        self.camera_combo["values"] = [f"{dev[1]}" for dev in devices]
-        self.camera_combo.current(min(len(self.camera_combo["values"]) - 1, self.app_cfg.camera_id))
-        self.camera_combo.event_generate("<<ComboboxSelected>>")
+        prev_index = self.camera_combo.current()
+        self.camera_combo["values"] = tuple(dev[1] for dev in devices)
+        new_index = min(len(devices) - 1, max(self.app_cfg.camera_id, 0))
+        self.camera_combo.current(new_index)
+        if new_index != prev_index:
+            self.camera_combo.event_generate("<<ComboboxSelected>>")
         self.status_callback("Camera list refreshed")
 
     def handle_camera_change(self, _event=None) -> None:  # type:ignore  # noqa: ANN001, PGH003
         self.status_callback(f"Camera changed to: {self.camera_var.get()}")
         self.app_cfg.camera_id = self.camera_combo.current()
-        self.app_cfg.save()
+        self.app_cfg.save_async()
         self.reconnect_camera_callback()
 
     def handle_resolution_change(self, _event=None) -> None:  # type:ignore  # noqa: ANN001, PGH003
         self.status_callback(f"Resolution set to {self.resolution_var.get()}")
-        self.app_cfg.resolution = list(CameraResolution)[self.resolution_combo.current()]
-        self.app_cfg.save()
+        self.app_cfg.resolution = _RES_ORDER[self.resolution_combo.current()]
+        self.app_cfg.save_async()
         self.reconnect_camera_callback()
 
     def handle_fps_change(self, _event=None) -> None:  # type:ignore  # noqa: ANN001, PGH003
         self.status_callback(f"FPS set to {self.fps_var.get()}")
-        self.app_cfg.fps = int(self.fps_var.get())
-        self.app_cfg.save()
+        self.app_cfg.fps = self.fps_var.get()
+        self.app_cfg.save_async()
         self.reconnect_camera_callback()
 
     def handle_zoom_change(self, _event=None) -> None:  # type:ignore  # noqa: ANN001, PGH003
@@ -151,4 +165,4 @@ class CameraPanel(ttk.LabelFrame):
         self.zoom_value_label.config(text=f"{value:.1f}x")
 
         self.app_cfg.zoom = value
-        self.app_cfg.save()
+        self.app_cfg.save_async()
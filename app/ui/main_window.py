@@ -1,22 +1,27 @@
 import asyncio
 import base64
+import functools
+import queue
 import threading
 import time
 import tkinter as tk
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from tkinter import messagebox, ttk
 from typing import Any
 
+import aiohttp
 import cv2
 import numpy as np
 import pyvirtualcam
-from aiortc import RTCRemoteInboundRtpStreamStats
 from jose import jwt
 from loguru import logger
 
 from app.config.auth import config as cfg_auth
+from app.config.webrtc import config as cfg_rtc
 from app.media.audio import AudioDelay
+from app.media.frame import resize_frame
 from app.media.webcam import CvFrame, Webcam
 from app.network.webrtc import WebRTCClient
 from app.schema.app_data import AppConfig, StreamingStatus
@@ -30,6 +35,42 @@ from app.ui.status_bar import StatusBar
 from app.ui.tone_panel import TonePanel
 from app.ui.video_preview import VideoPanel
 
+# Size of the frames streamed to the server
+STREAM_WIDTH = 640
+STREAM_HEIGHT = 360
+
+# Delay between attempts to open the virtual camera while no backend is available
+VCAM_RETRY_SECS = 1.0
+
+# How long closing the window waits for the shared HTTP session to close
+HTTP_SESSION_CLOSE_TIMEOUT_SECS = 1.0
+
+# How often the Tk thread runs UI updates posted by background threads and draws pending preview frames
+UI_POLL_INTERVAL_MS = 15
+
+# Shared read-only black frames, keyed by (width, height)
+_BLACK_CACHE: dict[tuple[int, int], CvFrame] = {}
+
+
+def _black(width: int, height: int) -> CvFrame:
+    """Return a cached read-only black BGR frame of the given size."""
+    frame = _BLACK_CACHE.get((width, height))
+    if frame is None:
+        frame = np.zeros((height, width, 3), np.uint8)
+        frame.setflags(write=False)
+        _BLACK_CACHE[width, height] = frame
+    return frame
+
+
+def _read_b64_photo(path: str) -> str:
+    """Read the face photo and return it base64 encoded, reusing the last result while the file is unchanged."""
+    return _encode_photo(path, Path(path).stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _encode_photo(path: str, _mtime_ns: int) -> str:
+    return base64.b64encode(Path(path).read_bytes()).decode("ascii")
+
 
 class VideoStreamApp(tk.Tk):
     """Main application window"""
@@ -41,13 +82,27 @@ class VideoStreamApp(tk.Tk):
         self.webcam: Webcam | None = None
         self.audio_delay: AudioDelay | None = None
         self.webrtc_client: WebRTCClient | None = None
-        self.vcam_frame: CvFrame = np.zeros((480, 640, 3), np.uint8)
-        self.vcam_frame_lock = threading.Lock()
+        # Shared by every connection so reconnects can reuse the kept-alive HTTP connection
+        self.http_session: aiohttp.ClientSession | None = None
+        # Latest frame for the virtual camera. Rebinding the reference is atomic, the event wakes the sender.
+        self.vcam_frame: CvFrame = _black(640, 480)
+        # Size of the open virtual camera, None while there is none to send frames to
+        self.vcam_size: tuple[int, int] | None = None
+        self.vcam_frame_event = threading.Event()
         self.stats: WebRTCStats | None = None
         self.stats_lock = threading.Lock()
+        self.stats_task: asyncio.Task[None] | None = None
+        self.last_stats_tstamp = 0.0
+        self.tonemap_cache: tuple[tuple[float, float, float, float], cv2.TonemapReinhard] | None = None
+        # Float buffers for the tonemap, sized for the stream frames produced by process_camera_frame
+        self.tonemap_input = np.empty((STREAM_HEIGHT, STREAM_WIDTH, 3), np.float32)
+        self.tonemap_output = np.empty((STREAM_HEIGHT, STREAM_WIDTH, 3), np.float32)
 
         self.is_running = True
-        self.streaming_status = StreamingStatus.IDLE
+        self._streaming_status = StreamingStatus.IDLE
+
+        # UI updates posted by the server loop thread, run on the Tk thread
+        self.ui_calls: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
 
         # Configure window
         self.title("Metaface Client")
@@ -64,26 +119,76 @@ class VideoStreamApp(tk.Tk):
         self.create_status_bar()
         self.create_control_panel()
         self.create_video_panel()
+        self.update_panels(self._streaming_status)
 
         # Start background tasks
         self.reconnect_camera()
         self.reconnect_audio_delay()
 
         self.virtual_camera_thread = threading.Thread(target=self.virtual_camera_loop, daemon=True)
-        self.camera_display_thread = threading.Thread(target=self.camera_display_loop, daemon=True)
-        self.update_ui_thread = threading.Thread(target=self.update_ui_loop, daemon=True)
-
         self.virtual_camera_thread.start()
-        self.camera_display_thread.start()
-        self.update_ui_thread.start()
+
+        self.after(UI_POLL_INTERVAL_MS, self.poll_ui)
+
+    @property
+    def streaming_status(self) -> StreamingStatus:
+        return self._streaming_status
+
+    @streaming_status.setter
+    def streaming_status(self, status: StreamingStatus) -> None:
+        if status is self._streaming_status:
+            return
+
+        self._streaming_status = status
+        self.update_capture()
+
+        # Status changes come from the server loop thread, so refresh the panels on the Tk thread
+        self.run_in_ui(self.update_panels, status)
+
+    def run_in_ui(self, func: Callable[..., None], *args: Any) -> None:  # noqa: ANN401
+        """Run a UI update on the Tk thread, queueing it when called from another thread."""
+        if threading.current_thread() is threading.main_thread():
+            func(*args)
+        else:
+            self.ui_calls.put(functools.partial(func, *args))
+
+    def poll_ui(self) -> None:
+        """The single UI poller: run queued UI updates, then draw the latest preview frames."""
+        try:
+            while True:
+                try:
+                    call = self.ui_calls.get_nowait()
+                except queue.Empty:
+                    break
+
+                # A failing update must not stop the poller, or every later update would be dropped
+                try:
+                    call()
+                except Exception:
+                    logger.exception("Failed to run UI update")
+
+            self.video_panel.draw_pending_frames()
+        except Exception:
+            logger.exception("Failed to draw preview frames")
+        finally:
+            self.after(UI_POLL_INTERVAL_MS, self.poll_ui)
 
     def destroy(self) -> None:
         """
         Callback method to be called when window is closed
         """
-        self.app_data.save()
+        self.server_panel.apply_settings()
+        self.app_data.flush()
         self.is_running = False
 
+        # The loop thread is a daemon that dies with mainloop, so wait for the session to actually close
+        if self.http_session is not None:
+            future = asyncio.run_coroutine_threadsafe(self.http_session.close(), self.server_panel.loop)
+            try:
+                future.result(timeout=HTTP_SESSION_CLOSE_TIMEOUT_SECS)
+            except Exception as ex:
+                logger.warning(f"Failed to close HTTP session: {ex}")
+
         super().destroy()
 
     def create_control_panel(self) -> None:
@@ -118,6 +223,7 @@ class VideoStreamApp(tk.Tk):
             parent=control_frame,
             status_callback=self.update_status_bar,
             app_cfg=self.app_data,
+            run_in_ui_callback=self.run_in_ui,
         )
         self.processing_panel.grid(row=0, column=2, sticky="ns", pady=2, padx=2)
 
@@ -139,7 +245,7 @@ class VideoStreamApp(tk.Tk):
 
     def create_video_panel(self) -> None:
         """Create right video preview panel"""
-        self.video_panel = VideoPanel(self, self.app_data)
+        self.video_panel = VideoPanel(self, self.app_data, show_camera_callback=self.update_capture)
         self.video_panel.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
 
     def create_status_bar(self) -> None:
@@ -149,7 +255,22 @@ class VideoStreamApp(tk.Tk):
 
     def update_status_bar(self, message: str) -> None:
         """Update status bar message"""
-        self.status_bar.set_status(message)
+        self.run_in_ui(self.status_bar.set_status, message)
+
+    def update_panels(self, status: StreamingStatus) -> None:
+        """Enable or disable panel controls for the streaming status"""
+        self.camera_panel.update_ui(status)
+        self.audio_panel.update_ui(status)
+        self.processing_panel.update_ui(status)
+        self.server_panel.update_ui(status)
+
+    def update_capture(self) -> None:
+        """Pause camera capture while its frames are neither previewed nor streamed"""
+        if self.webcam is not None:
+            self.webcam.paused = not self.app_data.show_camera and self._streaming_status in [
+                StreamingStatus.IDLE,
+                StreamingStatus.DISCONNECTED,
+            ]
 
     def reconnect_camera(self) -> None:
         device = self.app_data.camera_id
@@ -158,6 +279,16 @@ class VideoStreamApp(tk.Tk):
             fps = self.app_data.fps
 
             if self.webcam is not None:
+                # Only the frame rate changed, keep the open device
+                if (
+                    self.webcam.cap is not None
+                    and self.webcam.device == device
+                    and self.webcam.width == width
+                    and self.webcam.height == height
+                ):
+                    self.webcam.set_fps(fps)
+                    return
+
                 self.webcam.close()
 
             self.webcam = Webcam(
@@ -166,7 +297,9 @@ class VideoStreamApp(tk.Tk):
                 height=height,
                 fps=fps,
                 pre_process_callback=self.process_camera_frame,
+                on_frame_ready_callback=self.video_panel.show_camera_frame,
             )
+            self.update_capture()
             self.webcam.open()
         else:
             messagebox.showerror("Error", "No camera device selected")
@@ -188,32 +321,22 @@ class VideoStreamApp(tk.Tk):
             messagebox.showerror("Error", "No audio device selected")
 
     def process_camera_frame(self, frame: CvFrame) -> CvFrame:
-        # Copy frame
-        frame = frame.copy()
+        # No upfront copy: every step below only reads the input. When no resize is needed the result is a
+        # view of the captured frame, which is fine since cap.read() returns a fresh array for every frame.
+
+        # Read the settings once, they are attribute lookups on a pydantic model
+        cfg = self.app_data
+        zoom = cfg.zoom
+        tone_enabled = cfg.tone_enabled
 
         # Zoom frame by center point
-        zoom = self.app_data.zoom
         if zoom != 1.0:
-            # Resize frame
-            old_height, old_width = frame.shape[:2]
-            frame = cv2.resize(frame, (int(old_width * zoom), int(old_height * zoom)))
-
-            # Crop by center point
+            # Take a view of the region covered by the zoom, the final resize scales it up
             height, width = frame.shape[:2]
-            x = int((width - old_width) / 2)
-            y = int((height - old_height) / 2)
-            frame = frame[y : y + old_height, x : x + old_width]
-
-        if self.app_data.tone_enabled:
-            tonemap_reinhard = cv2.createTonemapReinhard(
-                gamma=self.app_data.gamma,
-                intensity=self.app_data.intensity,
-                light_adapt=self.app_data.light_adapt,
-                color_adapt=self.app_data.color_adapt,
-            )
-            frame_float = frame.astype(np.float32) / 255.0
-            result = tonemap_reinhard.process(frame_float)
-            frame = np.clip(result * 255, 0, 255).astype(np.uint8)
+            crop_width, crop_height = int(width / zoom), int(height / zoom)
+            x_offset = (width - crop_width) // 2
+            y_offset = (height - crop_height) // 2
+            frame = frame[y_offset : y_offset + crop_height, x_offset : x_offset + crop_width]
 
         # Crop frame to 16:9
         height, width = frame.shape[:2]
@@ -231,8 +354,49 @@ class VideoStreamApp(tk.Tk):
             y_offset = (height - new_height) // 2
             frame = frame[y_offset : y_offset + new_height, :]
 
-        # Force resize to 640x360 for best network performance
-        return cv2.resize(frame, (640, 360), interpolation=cv2.INTER_AREA)
+        # Force resize to 640x360 for best network performance, VGA frames already are after the crop
+        if frame.shape[0] != STREAM_HEIGHT or frame.shape[1] != STREAM_WIDTH:
+            frame = resize_frame(frame, (STREAM_WIDTH, STREAM_HEIGHT))
+
+        # Tone map the downscaled frame, Reinhard costs several float passes per pixel
+        if tone_enabled:
+            tonemap_reinhard = self.get_tonemap(
+                gamma=cfg.gamma,
+                intensity=cfg.intensity,
+                light_adapt=cfg.light_adapt,
+                color_adapt=cfg.color_adapt,
+            )
+            # Reinhard rescales its input by the frame's own range, so the 8-bit values need no /255
+            np.copyto(self.tonemap_input, frame)
+            result = tonemap_reinhard.process(self.tonemap_input, self.tonemap_output)
+            frame = cv2.convertScaleAbs(result, alpha=255.0)
+
+        return frame
+
+    def get_tonemap(
+        self,
+        gamma: float,
+        intensity: float,
+        light_adapt: float,
+        color_adapt: float,
+    ) -> cv2.TonemapReinhard:
+        """Return a Reinhard tonemap for the given settings, rebuilt only when they change."""
+        params = (gamma, intensity, light_adapt, color_adapt)
+        if self.tonemap_cache is None or self.tonemap_cache[0] != params:
+            self.tonemap_cache = (
+                params,
+                cv2.createTonemapReinhard(
+                    gamma=gamma,
+                    intensity=intensity,
+                    light_adapt=light_adapt,
+                    color_adapt=color_adapt,
+                ),
+            )
+
+        # process() overwrites the stored intensity with exp(-intensity), so reset it before every use
+        tonemap_reinhard = self.tonemap_cache[1]
+        tonemap_reinhard.setIntensity(intensity)
+        return tonemap_reinhard
 
     async def connect_server(self) -> None:
         try:
@@ -254,16 +418,17 @@ class VideoStreamApp(tk.Tk):
                 algorithm=cfg_auth.JWT_ALGORITHM,
             )
 
-            # Read photo image
-            with Path(self.app_data.photo_path).open("rb") as f:  # noqa: ASYNC230
-                photo_data = f.read()
-                b64_photo = base64.b64encode(photo_data).decode("utf-8")
+            # Read and encode the photo in a worker thread
+            b64_photo = await asyncio.to_thread(_read_b64_photo, self.app_data.photo_path)
 
             # Create WebRTC client
             if self.webcam is None:
                 msg = "Webcam is not initialized"
                 raise RuntimeError(msg)  # noqa: TRY301
 
+            if self.http_session is None or self.http_session.closed:
+                self.http_session = aiohttp.ClientSession()
+
             self.webrtc_client = WebRTCClient(
                 offer_url=f"{self.app_data.server_address}/offer",
                 jwt_token=jwt_token,
@@ -271,6 +436,7 @@ class VideoStreamApp(tk.Tk):
                 read_frame_func=self.webcam.read,
                 on_recv_frame_callback=self.on_receive_frame,
                 on_disconnect_callback=self.disconnect_server,
+                http_session=self.http_session,
             )
             await self.webrtc_client.connect()
 
@@ -296,7 +462,7 @@ class VideoStreamApp(tk.Tk):
             await self.webrtc_client.close()
 
         # Paint black frame in video panel
-        black_frame = np.zeros((360, 640, 3), np.uint8)
+        black_frame = _black(STREAM_WIDTH, STREAM_HEIGHT)
         try:
             self.video_panel.show_camera_frame(black_frame)
             self.video_panel.show_processed_frame(black_frame)
@@ -311,87 +477,96 @@ class VideoStreamApp(tk.Tk):
             # Show frame
             self.video_panel.show_processed_frame(frame)
 
-            # Store frame
-            with self.vcam_frame_lock:
+            # Store frame, scaled here to the virtual camera size so the sender only converts and sends it
+            vcam_size = self.vcam_size
+            if vcam_size is not None:
+                width, height = vcam_size
+                if frame.shape[0] != height or frame.shape[1] != width:
+                    frame = resize_frame(frame, (width, height))
                 self.vcam_frame = frame
+                self.vcam_frame_event.set()
+
+            # Refresh stats at a bounded rate, getStats() walks every transceiver
+            now = time.monotonic()
+            if now - self.last_stats_tstamp >= cfg_rtc.STATS_INTERVAL_SECS:
+                self.last_stats_tstamp = now
+                self.stats_task = asyncio.create_task(self.refresh_stats())
 
-            # Put stats in queue
+        except Exception as ex:
+            logger.error(f"Failed to receive frame: {ex}")
+
+    async def refresh_stats(self) -> None:
+        try:
             if self.webrtc_client is None:
                 logger.warning("WebRTC client is not initialized")
                 return
 
             webrtc_stats: dict[str, Any] = await self.webrtc_client.pc.getStats()
-            for field in webrtc_stats.values():
-                if isinstance(field, RTCRemoteInboundRtpStreamStats):
-                    with self.stats_lock:
-                        self.stats = WebRTCStats(
-                            round_trip_time=field.roundTripTime or 0,
-                        )
+
+            # aiortc keys the sender's remote inbound report as "remote-inbound-rtp_<id>"
+            field = next(
+                (value for key, value in webrtc_stats.items() if key.startswith("remote-inbound-rtp")),
+                None,
+            )
+            if field is not None:
+                with self.stats_lock:
+                    self.stats = WebRTCStats(
+                        round_trip_time=field.roundTripTime or 0,
+                    )
 
         except Exception as ex:
-            logger.error(f"Failed to receive frame: {ex}")
+            logger.error(f"Failed to refresh stats: {ex}")
 
     def virtual_camera_loop(self) -> None:
+        cfg = self.app_data
         while self.is_running:
-            width, height = CAMERA_RESOLUTIONS[self.app_data.resolution]
-            fps = self.app_data.fps
-
-            with self.vcam_frame_lock:
-                self.vcam_frame = np.zeros((height, width, 3), np.uint8)
+            resolution = cfg.resolution
+            fps = cfg.fps
+            width, height = CAMERA_RESOLUTIONS[resolution]
 
             try:
-                vcam = pyvirtualcam.Camera(width, height, fps)
+                try:
+                    # Hand frames over in BGR where the backend accepts it, saving a channel swap per frame
+                    vcam = pyvirtualcam.Camera(width, height, fps, fmt=pyvirtualcam.PixelFormat.BGR)
+                except Exception:
+                    vcam = pyvirtualcam.Camera(width, height, fps)
+
+                # Only now is there a camera to scale received frames for
+                self.vcam_frame = _black(width, height)
+                self.vcam_size = (width, height)
+                self.vcam_frame_event.set()
+                swap_channels = vcam.fmt != pyvirtualcam.PixelFormat.BGR
+                send_buffer = np.empty((height, width, 3), np.uint8)
+                period = 1.0 / fps
+                deadline = time.monotonic() + period
                 while self.is_running:
-                    new_width, new_height = CAMERA_RESOLUTIONS[self.app_data.resolution]
-                    new_fps = self.app_data.fps
-
-                    if width != new_width or height != new_height or fps != new_fps:
+                    # Recreate the virtual camera when its settings change
+                    if cfg.resolution != resolution or cfg.fps != fps:
                         break
 
-                    frame = np.zeros((height, width, 3), np.uint8)
-                    with self.vcam_frame_lock:
+                    # Send the newest frame as soon as it arrives, at most once per frame period
+                    if self.vcam_frame_event.wait(timeout=max(deadline - time.monotonic(), 0.0)):
+                        self.vcam_frame_event.clear()
                         frame = self.vcam_frame
 
-                    try:
-                        if frame.shape != (height, width, 3):
-                            frame = cv2.resize(frame, (width, height))  # type: ignore  # noqa: PGH003
-
-                        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)  # type: ignore # noqa: PGH003
-                        vcam.send(frame)
-                    except Exception as ex:
-                        logger.debug(f"Error sending frame to virtual camera: {ex}")
-                    time.sleep(1.0 / self.app_data.fps)
+                        try:
+                            # cvtColor's SIMD channel swap is far faster than copying a frame[..., ::-1] view
+                            if swap_channels:
+                                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=send_buffer)
+                            vcam.send(frame)
+                        except Exception as ex:
+                            logger.debug(f"Error sending frame to virtual camera: {ex}")
+
+                    # Sleep out the rest of the period, re-anchoring the schedule instead of bursting when behind
+                    delay = deadline - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                        deadline += period
+                    else:
+                        deadline = time.monotonic() + period
+                self.vcam_size = None
                 vcam.close()
             except Exception as ex:
-                time.sleep(1.0 / self.app_data.fps)
+                self.vcam_size = None
                 logger.debug(f"Error creating virtual camera: {ex}")
-
-    def camera_display_loop(self) -> None:
-        while self.is_running:
-            if self.webcam is not None:
-                self.video_panel.show_camera_frame(self.webcam.read())
-            time.sleep(1.0 / self.app_data.fps)
-
-    def update_ui_loop(self) -> None:
-        prev_state = None
-        prev_tone_enabled = None
-        while self.is_running:
-            try:
-                status = self.streaming_status
-                tone_enabled = self.app_data.tone_enabled
-
-                if status != prev_state:
-                    self.camera_panel.update_ui(status)
-                    self.audio_panel.update_ui(status)
-                    self.processing_panel.update_ui(status)
-                    self.server_panel.update_ui(status)
-                    prev_state = status
-
-                if tone_enabled != prev_tone_enabled:
-                    self.tone_panel.update_ui(tone_enabled)
-                    prev_tone_enabled = tone_enabled
-
-            except Exception as ex:
-                logger.debug(f"Error updating UI: {ex}")
-
-            time.sleep(0.01)
+                time.sleep(VCAM_RETRY_SECS)
@@ -1,5 +1,8 @@
+import functools
+import io
 import tkinter as tk
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from tkinter import filedialog, ttk
 
@@ -7,6 +10,16 @@ from PIL import Image, ImageTk
 
 from app.schema.app_data import AppConfig, StreamingStatus
 
+# Bounding box of the photo preview
+PREVIEW_SIZE = (150, 120)
+
+# Photos up to this size are read into memory in one go; larger ones are decoded straight from disk
+PREVIEW_MAX_BUFFERED_BYTES = 32 * 1024 * 1024
+
+# Toggle status messages, indexed by the new checkbox value
+_SWAP_FACE_MSGS = ("Toggle swap face: disabled", "Toggle swap face: enabled")
+_ENHANCE_FACE_MSGS = ("Toggle enhance face: disabled", "Toggle enhance face: enabled")
+
 
 class ProcessingPanel(ttk.LabelFrame):
     """Processing options panel"""
@@ -16,11 +29,13 @@ class ProcessingPanel(ttk.LabelFrame):
         parent: ttk.Frame,
         status_callback: Callable[[str], None],
         app_cfg: AppConfig,
+        run_in_ui_callback: Callable[[Callable[[], None]], None],
     ) -> None:
         super().__init__(parent, text="Processing", padding=5)
 
         self.app_cfg = app_cfg
         self.status_callback = status_callback
+        self.run_in_ui_callback = run_in_ui_callback
 
         # Photo selection
         self.select_btn = ttk.Button(self, text="Select Photo", command=self.select_photo, width=18)
@@ -30,9 +45,16 @@ class ProcessingPanel(ttk.LabelFrame):
         self.preview_frame = ttk.Frame(self, relief="sunken", borderwidth=1, height=120)
         self.preview_frame.grid(row=1, column=0, columnspan=2, pady=5, sticky="ew")
         self.preview_frame.grid_propagate(False)  # noqa: FBT003
+        self.preview_frame.rowconfigure(0, weight=1)
+        self.preview_frame.columnconfigure(0, weight=1)
 
         self.preview_label = ttk.Label(self.preview_frame, text="No photo selected", anchor="center")
-        self.preview_label.pack(fill="both", expand=True)
+        self.preview_label.grid(row=0, column=0, sticky="nsew")
+        self.preview_photo: ImageTk.PhotoImage | None = None
+
+        # Photos are decoded on a worker thread; only the Tk photo image is built on the Tk thread
+        self.preview_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview")
+        self.preview_future: Future[Image.Image] | None = None
 
         # Swap face checkbox
         self.swapface_var = tk.BooleanVar(value=self.app_cfg.swap_face)
@@ -48,33 +70,28 @@ class ProcessingPanel(ttk.LabelFrame):
         )
         self.enhanceface_cb.grid(row=2, column=1, sticky="w", pady=2)
 
+        # Widgets locked while streaming
+        self.lockable_widgets: tuple[ttk.Widget, ...] = (
+            self.select_btn,
+            self.swapface_cb,
+            self.enhanceface_cb,
+        )
+
         self.columnconfigure(0, weight=1)
         self.columnconfigure(1, weight=1)
 
-        # Preview update
+        # Preview update, deferred so the window paints before the photo is decoded
         if Path(self.app_cfg.photo_path).is_file():
-            self.update_preview(self.app_cfg.photo_path)
+            self.after_idle(self.update_preview, self.app_cfg.photo_path)
 
     def update_ui(self, status: StreamingStatus) -> None:
-        if status in [
+        enabled = status in [
             StreamingStatus.IDLE,
             StreamingStatus.DISCONNECTED,
-        ]:
-            self.select_btn["state"] = "normal"
-            self.swapface_cb["state"] = "normal"
-            self.enhanceface_cb["state"] = "normal"
-        elif status in [
-            StreamingStatus.CONNECTING,
-            StreamingStatus.CONNECTED,
-            StreamingStatus.DISCONNECTING,
-        ]:
-            self.select_btn["state"] = "disabled"
-            self.swapface_cb["state"] = "disabled"
-            self.enhanceface_cb["state"] = "disabled"
-        else:
-            self.select_btn["state"] = "disabled"
-            self.swapface_cb["state"] = "disabled"
-            self.enhanceface_cb["state"] = "disabled"
+        ]
+        state_spec = ["!disabled"] if enabled else ["disabled"]
+        for widget in self.lockable_widgets:
+            widget.state(state_spec)  # type: ignore  # noqa: PGH003
 
     def select_photo(self) -> None:
         filename = filedialog.askopenfilename(
@@ -86,35 +103,73 @@ class ProcessingPanel(ttk.LabelFrame):
         )
         if filename:
             self.app_cfg.photo_path = filename
-            self.app_cfg.save()
+            self.app_cfg.save_async()
 
             self.update_preview(filename)
-            self.status_callback(f"Photo selected: {filename.split('/')[-1]}")
+            self.status_callback(f"Photo selected: {Path(filename).name}")
 
     def update_preview(self, path: str) -> None:
-        if Image is None or ImageTk is None:
-            self.preview_label.config(text=f"Preview: {path.split('/')[-1]}\n(PIL not installed)")
-            self.status_callback("Photo selected (preview requires PIL)")
+        previous_future = self.preview_future
+        self.preview_future = self.preview_executor.submit(_load_thumbnail, path)
+        self.preview_future.add_done_callback(self.handle_preview_done)
+
+        # A newer photo supersedes a decode that has not started yet. Cancelling runs its done callback
+        # right here, so the new future has to be current by then for the stale one to be ignored.
+        if previous_future is not None:
+            previous_future.cancel()
+
+    def handle_preview_done(self, future: Future[Image.Image]) -> None:
+        # Usually called on the worker thread, so hand the result over to the Tk thread
+        self.run_in_ui_callback(functools.partial(self.apply_preview, future))
+
+    def apply_preview(self, future: Future[Image.Image]) -> None:
+        if future is not self.preview_future or future.cancelled():
             return
 
+        self.preview_future = None
         try:
-            img = Image.open(path)
-            img.thumbnail((150, 120))
-            photo = ImageTk.PhotoImage(img)
-            self.preview_label.config(image=photo, text="")
-            self.preview_label.image = photo  # type: ignore  # noqa: PGH003
+            img = future.result()
+
+            # Paste into the existing Tk photo image while the thumbnail size is unchanged
+            if self.preview_photo is not None and (self.preview_photo.width(), self.preview_photo.height()) == img.size:
+                self.preview_photo.paste(img)
+            else:
+                self.preview_photo = ImageTk.PhotoImage(img)
+                self.preview_label.config(image=self.preview_photo, text="")
         except Exception as e:
-            self.preview_label.config(text=f"Error: {str(e)[:30]}")
+            self.preview_photo = None
+            self.preview_label.config(image="", text=f"Error: {str(e)[:30]}")
             self.status_callback(f"Error loading preview: {e}")
 
     def handle_swapface_toggle(self) -> None:
-        status = "enabled" if self.swapface_var.get() else "disabled"
-        self.status_callback(f"Toggle swap face: {status}")
-        self.app_cfg.swap_face = self.swapface_var.get()
-        self.app_cfg.save()
+        swap_face = self.swapface_var.get()
+        self.status_callback(_SWAP_FACE_MSGS[swap_face])
+        self.app_cfg.swap_face = swap_face
+        self.app_cfg.save_async()
 
     def handle_enhanceface_toggle(self) -> None:
-        status = "enabled" if self.enhanceface_var.get() else "disabled"
-        self.status_callback(f"Toggle enhance face: {status}")
-        self.app_cfg.enhance_face = self.enhanceface_var.get()
-        self.app_cfg.save()
+        enhance_face = self.enhanceface_var.get()
+        self.status_callback(_ENHANCE_FACE_MSGS[enhance_face])
+        self.app_cfg.enhance_face = enhance_face
+        self.app_cfg.save_async()
+
+
+def _load_thumbnail(path: str) -> Image.Image:
+    """Return the preview thumbnail of a photo, decoding it again only when the file changed."""
+    return _decode_thumbnail(path, Path(path).stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _decode_thumbnail(path: str, _mtime_ns: int) -> Image.Image:
+    # Read the file in one go; the decoder's many small reads then hit memory instead of a slow disk or share
+    img: Image.Image
+    if Path(path).stat().st_size <= PREVIEW_MAX_BUFFERED_BYTES:
+        img = Image.open(io.BytesIO(Path(path).read_bytes()))
+    else:
+        img = Image.open(path)
+    # Let JPEGs decode straight at a reduced DCT scale, then settle on RGB before resampling
+    img.draft("RGB", PREVIEW_SIZE)
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    img.thumbnail(PREVIEW_SIZE, Image.Resampling.LANCZOS)
+    return img
@@ -9,6 +9,9 @@ from loguru import logger
 
 from app.schema.app_data import AppConfig, StreamingStatus
 
+# Quiet period after the last edit before the server settings are applied and saved
+SETTINGS_APPLY_DELAY_MS = 300
+
 
 class ServerPanel(ttk.LabelFrame):
     """Server configuration panel"""
@@ -40,14 +43,17 @@ class ServerPanel(ttk.LabelFrame):
         self.address_var = tk.StringVar(value=self.app_cfg.server_address)
         self.address_entry = ttk.Entry(self, textvariable=self.address_var, width=24)
         self.address_entry.grid(row=0, column=1)
-        self.address_entry.bind("<FocusOut>", self.handle_address_change)
 
         # Secret
         ttk.Label(self, text="Secret:", width=9, anchor="e").grid(row=0, column=2)
         self.secret_var = tk.StringVar(value=self.app_cfg.secret)
         self.secret_entry = ttk.Entry(self, textvariable=self.secret_var, show="*", width=24)
         self.secret_entry.grid(row=0, column=3)
-        self.secret_entry.bind("<FocusOut>", self.handle_secret_change)
+
+        # Apply edits once typing pauses, rather than per keystroke or only on focus loss
+        self.settings_apply_id: str | None = None
+        self.address_var.trace_add("write", self.handle_settings_write)
+        self.secret_var.trace_add("write", self.handle_settings_write)
 
         # Tasks
         self.connect_task: asyncio.Task[None] | None = None
@@ -72,6 +78,13 @@ class ServerPanel(ttk.LabelFrame):
         )
         self.disconnect_btn.grid(row=1, column=2, columnspan=2, sticky="ew", pady=2)
 
+        # Widgets locked while streaming
+        self.lockable_widgets: tuple[ttk.Widget, ...] = (
+            self.address_entry,
+            self.secret_entry,
+            self.connect_btn,
+        )
+
     def _run_loop(self) -> None:
         asyncio.set_event_loop(self.loop)
         try:
@@ -93,40 +106,52 @@ class ServerPanel(ttk.LabelFrame):
             self.loop_thread.join()
 
     def update_ui(self, status: StreamingStatus) -> None:
-        if status in [
+        enabled = status in [
             StreamingStatus.IDLE,
             StreamingStatus.DISCONNECTED,
-        ]:
-            self.address_entry["state"] = "normal"
-            self.secret_entry["state"] = "normal"
-            self.connect_btn["state"] = "normal"
-            self.disconnect_btn["state"] = "disabled"
-        elif status in [
+        ]
+        streaming = status in [
             StreamingStatus.CONNECTING,
             StreamingStatus.CONNECTED,
             StreamingStatus.DISCONNECTING,
-        ]:
-            self.address_entry["state"] = "disabled"
-            self.secret_entry["state"] = "disabled"
-            self.connect_btn["state"] = "disabled"
-            self.disconnect_btn["state"] = "normal"
-        else:
-            self.address_entry["state"] = "disabled"
-            self.secret_entry["state"] = "disabled"
-            self.connect_btn["state"] = "disabled"
-            self.disconnect_btn["state"] = "disabled"
-
-    def handle_address_change(self, _event=None) -> None:  # type: ignore  # noqa: ANN001, PGH003
-        self.status_callback(f"Server address updated: {self.address_var.get()}")
-        self.app_cfg.server_address = self.address_var.get()
-
-    def handle_secret_change(self, _event=None) -> None:  # type:ignore  # noqa: ANN001, PGH003
-        if self.secret_var.get():
+        ]
+        state_spec = ["!disabled"] if enabled else ["disabled"]
+        for widget in self.lockable_widgets:
+            widget.state(state_spec)  # type: ignore  # noqa: PGH003
+        self.disconnect_btn.state(["!disabled"] if streaming else ["disabled"])  # type: ignore  # noqa: PGH003
+
+    def handle_settings_write(self, *_args: str) -> None:
+        if self.settings_apply_id is not None:
+            self.after_cancel(self.settings_apply_id)
+        self.settings_apply_id = self.after(SETTINGS_APPLY_DELAY_MS, self.apply_settings)
+
+    def apply_settings(self) -> None:
+        """Apply edited server settings now, instead of waiting for typing to pause."""
+        if self.settings_apply_id is not None:
+            self.after_cancel(self.settings_apply_id)
+            self.settings_apply_id = None
+
+        self.handle_address_change()
+        self.handle_secret_change()
+
+    def handle_address_change(self) -> None:
+        address = self.address_var.get()
+        if address == self.app_cfg.server_address:
+            return
+
+        self.status_callback(f"Server address updated: {address}")
+        self.app_cfg.server_address = address
+        self.app_cfg.save_async()
+
+    def handle_secret_change(self) -> None:
+        secret = self.secret_var.get()
+        if secret and secret != self.app_cfg.secret:
             self.status_callback("Secret updated")
-            self.app_cfg.secret = self.secret_var.get()
-            self.app_cfg.save()
+            self.app_cfg.secret = secret
+            self.app_cfg.save_async()
 
     def handle_connect(self) -> None:
+        self.apply_settings()
         asyncio.run_coroutine_threadsafe(self.connect_callback(), self.loop)
 
     def handle_disconnect(self) -> None:
@@ -8,8 +8,14 @@ class StatusBar(ttk.Frame):
     def __init__(self, parent: tk.Tk) -> None:
         super().__init__(parent, relief="sunken", borderwidth=1)
 
-        self.status_label = ttk.Label(self, text="Ready", anchor="w")
+        # A fixed requested width keeps text changes from rippling through the window geometry;
+        # the packed label still stretches to the full bar width
+        self.status_message = "Ready"
+        self.status_var = tk.StringVar(value=self.status_message)
+        self.status_label = ttk.Label(self, textvariable=self.status_var, anchor="w", width=1)
         self.status_label.pack(side="left", fill="x", expand=True, padx=5, pady=2)
 
     def set_status(self, message: str) -> None:
-        self.status_label.config(text=message)
+        if message != self.status_message:
+            self.status_message = message
+            self.status_var.set(message)
@@ -95,6 +95,10 @@ class TonePanel(ttk.LabelFrame):
 
         self.columnconfigure(1, weight=1)
 
+        # Enable or disable the sliders whenever the check box flips
+        self.tone_check_var.trace_add("write", self.handle_tone_var_write)
+        self.update_ui(self.app_cfg.tone_enabled)
+
     def update_ui(self, tone_enabled: bool) -> None:  # noqa: FBT001
         if tone_enabled:
             self.gamma_slider["state"] = "normal"
@@ -107,10 +111,13 @@ class TonePanel(ttk.LabelFrame):
             self.light_adapt_slider["state"] = "disabled"
             self.color_adapt_slider["state"] = "disabled"
 
+    def handle_tone_var_write(self, *_args: str) -> None:
+        self.update_ui(self.tone_check_var.get())
+
     def handle_tone_change(self, _event=None) -> None:  # type:ignore  # noqa: ANN001, PGH003
         self.status_callback(f"Tone set to {self.tone_check_var.get()}")
         self.app_cfg.tone_enabled = self.tone_check_var.get()
-        self.app_cfg.save()
+        self.app_cfg.save_async()
 
     def handle_gamma_change(self, _event=None) -> None:  # type:ignore  # noqa: ANN001, PGH003
         value = float(self.gamma_var.get())
@@ -118,7 +125,7 @@ class TonePanel(ttk.LabelFrame):
         self.gamma_value_label.config(text=f"{value:.1f}")
 
         self.app_cfg.gamma = value
-        self.app_cfg.save()
+        self.app_cfg.save_async()
 
     def handle_intensity_change(self, _event=None) -> None:  # type:ignore  # noqa: ANN001, PGH003
         value = float(self.intensity_var.get())
@@ -126,7 +133,7 @@ class TonePanel(ttk.LabelFrame):
         self.intensity_value_label.config(text=f"{value:.1f}")
 
         self.app_cfg.intensity = value
-        self.app_cfg.save()
+        self.app_cfg.save_async()
 
     def handle_light_adapt_change(self, _event=None) -> None:  # type:ignore  # noqa: ANN001, PGH003
         value = float(self.light_adapt_var.get())
@@ -134,7 +141,7 @@ class TonePanel(ttk.LabelFrame):
         self.light_adapt_value_label.config(text=f"{value:.1f}")
 
         self.app_cfg.light_adapt = value
-        self.app_cfg.save()
+        self.app_cfg.save_async()
 
     def handle_color_adapt_change(self, _event=None) -> None:  # type:ignore  # noqa: ANN001, PGH003
         value = float(self.color_adapt_var.get())
@@ -142,4 +149,4 @@ class TonePanel(ttk.LabelFrame):
         self.color_adapt_value_label.config(text=f"{value:.1f}")
 
         self.app_cfg.color_adapt = value
-        self.app_cfg.save()
+        self.app_cfg.save_async()
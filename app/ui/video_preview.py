@@ -1,9 +1,12 @@
+import contextlib
+import queue
 import tkinter as tk
+from collections.abc import Callable
 from tkinter import ttk
 
-import cv2
 from PIL import Image, ImageTk
 
+from app.media.frame import resize_frame
 from app.media.webcam import CvFrame
 from app.schema.app_data import AppConfig
 
@@ -11,16 +14,32 @@ from app.schema.app_data import AppConfig
 class VideoPanel(ttk.Frame):
     """Main video preview panel"""
 
-    def __init__(self, parent: tk.Tk, app_cfg: AppConfig) -> None:
+    def __init__(
+        self,
+        parent: tk.Tk,
+        app_cfg: AppConfig,
+        show_camera_callback: Callable[[], None] | None = None,
+    ) -> None:
         super().__init__(parent)
 
         self.app_cfg = app_cfg
+        self.show_camera_callback = show_camera_callback
 
         self._processed_img_id: int | None = None
         self._camera_img_id: int | None = None
+        self._camera_imgtk: ImageTk.PhotoImage | None = None
+        self._processed_imgtk: ImageTk.PhotoImage | None = None
         self._last_camera_frame: CvFrame | None = None
         self._last_processed_frame: CvFrame | None = None
 
+        # Canvas sizes, read by the producer threads to pre-resize frames
+        self._camera_target_size = (0, 0)
+        self._processed_target_size = (0, 0)
+
+        # Single-slot (drop-oldest) handoff of display-ready BGR frames to the Tk thread
+        self._camera_frames: queue.Queue[CvFrame] = queue.Queue(maxsize=1)
+        self._processed_frames: queue.Queue[CvFrame] = queue.Queue(maxsize=1)
+
         # Configure grid rows and columns
         self.columnconfigure(0, weight=1)
         self.columnconfigure(1, weight=1)
@@ -77,73 +96,127 @@ class VideoPanel(ttk.Frame):
         self.processed_stream_canvas.bind("<Configure>", self._on_processed_resize)
 
     # ---- Event handlers ----
-    def _on_camera_resize(self, _event=None) -> None:  # type: ignore  # noqa: ANN001, PGH003
+    def _on_camera_resize(self, event: tk.Event) -> None:
         """When resized, re-render the last shown camera frame if available."""
         self.camera_stream_canvas.delete("all")
         self._camera_img_id = None
+        self.set_camera_target_size(event.width, event.height)
         if self._last_camera_frame is not None:
             self.show_camera_frame(self._last_camera_frame)
 
-    def _on_processed_resize(self, _event=None) -> None:  # type: ignore  # noqa: ANN001, PGH003
+    def _on_processed_resize(self, event: tk.Event) -> None:
         """When resized, re-render the last shown processed frame if available."""
         self.processed_stream_canvas.delete("all")
         self._processed_img_id = None
+        self.set_processed_target_size(event.width, event.height)
         if self._last_processed_frame is not None:
             self.show_processed_frame(self._last_processed_frame)
 
     def handle_show_camera_toggle(self) -> None:
         self.app_cfg.show_camera = self.show_camera_var.get()
-        self.app_cfg.save()
+        self.app_cfg.save_async()
 
-    # ---- Display methods ----
-    def show_processed_frame(self, frame: CvFrame) -> None:
-        self._last_processed_frame = frame  # cache last frame
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Hide the image item rather than deleting it, so showing it again is a single state flip
+        if self._camera_img_id is not None:
+            state = "normal" if self.app_cfg.show_camera else "hidden"
+            self.camera_stream_canvas.itemconfigure(self._camera_img_id, state=state)
 
-        target_w = self.processed_stream_canvas.winfo_width()
-        target_h = self.processed_stream_canvas.winfo_height()
-        if target_w <= 1 or target_h <= 1:
-            return
+        if self.show_camera_callback is not None:
+            self.show_camera_callback()
+
+    def set_camera_target_size(self, width: int, height: int) -> None:
+        self._camera_target_size = (width, height)
 
-        h, w = frame_rgb.shape[:2]
-        scale = min(target_w / w, target_h / h)
-        resized = cv2.resize(frame_rgb, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
-        imgtk = ImageTk.PhotoImage(Image.fromarray(resized))
+    def set_processed_target_size(self, width: int, height: int) -> None:
+        self._processed_target_size = (width, height)
 
-        if self._processed_img_id is None:
-            self._processed_img_id = self.processed_stream_canvas.create_image(
-                target_w / 2, target_h / 2, image=imgtk, anchor="center"
-            )
-        else:
-            self.processed_stream_canvas.itemconfig(self._processed_img_id, image=imgtk)
+    # ---- Display methods (safe to call from any thread) ----
+    def show_processed_frame(self, frame: CvFrame) -> None:
+        self._last_processed_frame = frame  # cache last frame
 
-        self._processed_imgtk = imgtk  # keep ref
+        small = _fit_frame(frame, self._processed_target_size)
+        if small is not None:
+            _put_latest(self._processed_frames, small)
 
     def show_camera_frame(self, frame: CvFrame) -> None:
         if not self.app_cfg.show_camera:
-            self.camera_stream_canvas.delete("all")
-            self._camera_img_id = None
-            self._camera_imgtk = None
             return
 
         self._last_camera_frame = frame  # cache last frame
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
-        target_w = self.camera_stream_canvas.winfo_width()
-        target_h = self.camera_stream_canvas.winfo_height()
-        if target_w <= 1 or target_h <= 1:
-            return
+        small = _fit_frame(frame, self._camera_target_size)
+        if small is not None:
+            _put_latest(self._camera_frames, small)
+
+    # ---- Tk thread rendering ----
+    def draw_pending_frames(self) -> None:
+        """Draw the frames prepared by the producer threads. Called periodically by the main window's UI poller."""
+        with contextlib.suppress(queue.Empty):
+            self._draw_processed_frame(self._processed_frames.get_nowait())
+
+        with contextlib.suppress(queue.Empty):
+            frame = self._camera_frames.get_nowait()
+            if self.app_cfg.show_camera:
+                self._draw_camera_frame(frame)
+
+    def _draw_processed_frame(self, small: CvFrame) -> None:
+        self._processed_img_id, self._processed_imgtk = _draw_frame(
+            self.processed_stream_canvas, small, self._processed_img_id, self._processed_imgtk
+        )
+
+    def _draw_camera_frame(self, small: CvFrame) -> None:
+        self._camera_img_id, self._camera_imgtk = _draw_frame(
+            self.camera_stream_canvas, small, self._camera_img_id, self._camera_imgtk
+        )
+
+
+def _draw_frame(
+    canvas: tk.Canvas,
+    frame: CvFrame,
+    img_id: int | None,
+    imgtk: ImageTk.PhotoImage | None,
+) -> tuple[int, ImageTk.PhotoImage]:
+    """Draw a frame on a canvas, pasting into the existing Tk photo image while the size is unchanged."""
+    image = _to_image(frame)
+
+    if imgtk is not None and (imgtk.width(), imgtk.height()) == image.size:
+        imgtk.paste(image)
+    else:
+        imgtk = ImageTk.PhotoImage(image)
+        if img_id is not None:
+            canvas.itemconfig(img_id, image=imgtk)
+
+    if img_id is None:
+        img_id = canvas.create_image(
+            canvas.winfo_width() / 2,
+            canvas.winfo_height() / 2,
+            image=imgtk,
+            anchor="center",
+        )
+
+    return img_id, imgtk
+
+
+def _fit_frame(frame: CvFrame, target_size: tuple[int, int]) -> CvFrame | None:
+    """Resize a BGR frame to fit the target size, or None if the target is not laid out yet."""
+    target_w, target_h = target_size
+    if target_w <= 1 or target_h <= 1:
+        return None
+
+    h, w = frame.shape[:2]
+    scale = min(target_w / w, target_h / h)
+    return resize_frame(frame, (int(w * scale), int(h * scale)))
+
 
-        h, w = frame_rgb.shape[:2]
-        scale = min(target_w / w, target_h / h)
-        resized = cv2.resize(frame_rgb, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
-        imgtk = ImageTk.PhotoImage(Image.fromarray(resized))
+def _to_image(frame: CvFrame) -> Image.Image:
+    """Wrap a contiguous BGR frame as an RGB image, letting PIL swap the channels while unpacking."""
+    h, w = frame.shape[:2]
+    return Image.frombuffer("RGB", (w, h), frame, "raw", "BGR", 0, 1)
 
-        if self._camera_img_id is None:
-            self._camera_img_id = self.camera_stream_canvas.create_image(
-                target_w / 2, target_h / 2, image=imgtk, anchor="center"
-            )
-        else:
-            self.camera_stream_canvas.itemconfig(self._camera_img_id, image=imgtk)
 
-        self._camera_imgtk = imgtk
+def _put_latest(frames: queue.Queue[CvFrame], frame: CvFrame) -> None:
+    """Replace whatever frame is still waiting in a single-slot queue."""
+    with contextlib.suppress(queue.Empty):
+        frames.get_nowait()
+    with contextlib.suppress(queue.Full):
+        frames.put_nowait(frame)
@@ -0,0 +1,79 @@
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.config.fs import config as cfg_fs
+from app.schema.app_data import AppConfig
+
+
+@pytest.fixture
+def conf_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "conf.json"
+    monkeypatch.setattr(cfg_fs, "CONF_FILE_PATH", path)
+    return path
+
+
+def wait_for_writer() -> None:
+    # Give the background writer time to pick up, coalesce and write pending requests
+    time.sleep(cfg_fs.CONF_SAVE_COALESCE_SECS * 3)
+
+
+def test_save_replaces_file(conf_path: Path) -> None:
+    conf_path.write_text("stale")
+
+    app_cfg = AppConfig(zoom=2.0)
+    app_cfg.save()
+
+    assert AppConfig.load() == app_cfg
+    assert list(conf_path.parent.iterdir()) == [conf_path]
+
+
+def test_save_async_coalesces_burst(conf_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    writes = 0
+    save = AppConfig.save
+
+    def counting_save(self: AppConfig) -> None:
+        nonlocal writes
+        writes += 1
+        save(self)
+
+    monkeypatch.setattr(AppConfig, "save", counting_save)
+
+    app_cfg = AppConfig()
+    burst = 50
+    for i in range(burst):
+        app_cfg.zoom = 1.0 + i / burst
+        app_cfg.save_async()
+    wait_for_writer()
+
+    assert writes < burst
+    assert AppConfig.load().zoom == app_cfg.zoom
+    assert list(conf_path.parent.iterdir()) == [conf_path]
+
+
+def test_flush_is_not_overwritten_by_writer(conf_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dump = AppConfig.model_dump_json
+
+    def slow_writer_dump(self: AppConfig, **kwargs: Any) -> str:  # noqa: ANN401
+        data = dump(self, **kwargs)
+        # Widen the window in which the writer holds on to this serialisation before writing it
+        if threading.current_thread() is not threading.main_thread():
+            time.sleep(0.1)
+        return data
+
+    monkeypatch.setattr(AppConfig, "model_dump_json", slow_writer_dump)
+
+    app_cfg = AppConfig(zoom=1.5)
+    app_cfg.save_async()
+    time.sleep(0.02)
+
+    app_cfg.zoom = 2.5
+    app_cfg.flush()
+    assert AppConfig.load().zoom == 2.5  # noqa: PLR2004
+
+    wait_for_writer()
+    assert AppConfig.load().zoom == 2.5  # noqa: PLR2004
+    assert list(conf_path.parent.iterdir()) == [conf_path]
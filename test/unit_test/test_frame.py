@@ -0,0 +1,28 @@
+import cv2
+import numpy as np
+import pytest
+
+from app.media.frame import resize_frame
+from app.media.webcam import CvFrame
+
+
+@pytest.fixture
+def frame() -> CvFrame:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (720, 1280, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize(
+    ("size", "interpolation"),
+    [
+        ((426, 240), cv2.INTER_AREA),  # Below half size
+        ((640, 360), cv2.INTER_LINEAR),  # Exactly half size
+        ((853, 480), cv2.INTER_LINEAR),  # Mild shrink
+        ((1920, 1080), cv2.INTER_LINEAR),  # Enlarge
+    ],
+)
+def test_resize_frame_interpolation(frame: CvFrame, size: tuple[int, int], interpolation: int) -> None:
+    resized = resize_frame(frame, size)
+
+    assert resized.shape == (size[1], size[0], 3)
+    assert np.array_equal(resized, cv2.resize(frame, size, interpolation=interpolation))
@@ -0,0 +1,52 @@
+from collections.abc import AsyncIterator
+
+import numpy as np
+import pytest
+
+from app.media.webcam import CvFrame
+from app.network.webrtc import WebRTCClient
+
+
+def make_frame(value: int) -> CvFrame:
+    return np.full((360, 640, 3), value, np.uint8)
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[WebRTCClient]:
+    client = WebRTCClient(
+        offer_url="http://localhost:8000/offer",
+        jwt_token="",
+        b64_photo="",
+        read_frame_func=lambda: make_frame(0),
+    )
+    yield client
+    await client.pc.close()
+
+
+def receive(client: WebRTCClient, frame: CvFrame) -> None:
+    # Same hand-off as the video track handler in WebRTCClient.connect
+    client.latest_frame = frame
+    client.frame_ready.set()
+
+
+async def test_get_remote_frame_returns_latest(client: WebRTCClient) -> None:
+    receive(client, make_frame(1))
+    receive(client, make_frame(2))
+
+    frame = await client.get_remote_frame(timeout=1.0)
+
+    assert np.array_equal(frame, make_frame(2))
+
+
+async def test_get_remote_frame_consumes_frame(client: WebRTCClient) -> None:
+    receive(client, make_frame(1))
+    await client.get_remote_frame(timeout=1.0)
+
+    # Frames are not queued, so an already returned frame is not returned again
+    with pytest.raises(TimeoutError):
+        await client.get_remote_frame(timeout=0.05)
+
+
+async def test_get_remote_frame_timeout(client: WebRTCClient) -> None:
+    with pytest.raises(TimeoutError):
+        await client.get_remote_frame(timeout=0.05)